@@ -1,5 +1,6 @@
 """Taskmarkのデータモデル定義"""
 
+import re
 from datetime import datetime
 
 # テンプレートファイル内で使用可能なプレースホルダ変数
@@ -9,6 +10,12 @@ TEMPLATE_VARIABLES = {
     "updated_at": "更新日時 (ISO 8601)",
 }
 
+_TEMPLATE_RE = re.compile(
+    rb"\{\{("
+    + b"|".join(re.escape(k.encode("utf-8")) for k in TEMPLATE_VARIABLES)
+    + rb")\}\}"
+)
+
 DEFAULT_TEMPLATE_CONTENT = """\
 ---
 status: todo
@@ -30,11 +37,17 @@ updated: {{updated_at}}
 """
 
 
-def render_template(content: str, title: str) -> str:
-    """テンプレートのプレースホルダを実際の値に置換する"""
-    now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-    return (
-        content.replace("{{title}}", title)
-        .replace("{{created_at}}", now)
-        .replace("{{updated_at}}", now)
-    )
+def render_template_bytes(
+    content: bytes, title: str, now: datetime | None = None
+) -> bytes:
+    """UTF-8 のテンプレートをデコードせずにプレースホルダを置換する
+
+    now を省略した場合は現在時刻を使用する。
+    """
+    timestamp = (now or datetime.now()).isoformat(timespec="seconds")
+    values = {
+        b"title": title.encode("utf-8"),
+        b"created_at": timestamp.encode("utf-8"),
+        b"updated_at": timestamp.encode("utf-8"),
+    }
+    return _TEMPLATE_RE.sub(lambda m: values[m.group(1)], content)
@@ -1,18 +1,42 @@
 """Taskmarkのストレージ操作 (~/.taskmark/ のファイル・ディレクトリ管理)"""
 
+import errno
+import functools
+import json
+import logging
+import os
+import re
 import shutil
+import stat
 import subprocess
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
-from taskmark.models import DEFAULT_TEMPLATE_CONTENT, render_template
+from taskmark.models import DEFAULT_TEMPLATE_CONTENT, render_template_bytes
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = Path.home() / ".taskmark"
 TEMPLATES_DIR = BASE_DIR / "templates"
 PROJECTS_DIR = BASE_DIR / "projects"
 TEMP_DIR = BASE_DIR / ".tmp"
+CACHE_DIR = BASE_DIR / ".cache"
+STATUS_INDEX_PATH = CACHE_DIR / "status_index.json"
+# 更新からこの時間（ナノ秒）以内の task.md はステータスインデックスに載せない。
+# 同じタイムスタンプ・サイズのまま書き換えられると変更を検出できないため。
+STATUS_INDEX_RACY_NS = 2_000_000_000
 RULES_FILENAME = "RULES.md"
+GLOBAL_RULES_PATH = BASE_DIR / RULES_FILENAME
 ARCHIVE_DIR_NAME = "_archive"
+# status 取得時に task.md の先頭から読み込むバイト数（frontmatter 部分のみ）
+STATUS_READ_SIZE = 1024
+# 検索でファイルを並列に読み込むスレッド数の上限（同時に開くファイル数も抑える）
+SEARCH_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
 
 
 def _run_git(*args: str) -> subprocess.CompletedProcess[str]:
@@ -26,8 +50,109 @@ def _run_git(*args: str) -> subprocess.CompletedProcess[str]:
     )
 
 
+def _read_bytes(path: str | Path, sequential: bool = False) -> bytes:
+    """ファイル全体をバイト列で読み取る（BufferedReader を経由しない）
+
+    sequential を指定すると、先頭から順に読むことを OS に伝えて先読みを促す。
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if sequential and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return _read_all(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    """fd から size バイトを読み切る。途中で EOF になればそこまでを返す。"""
+    remaining = size
+    chunks = []
+    while remaining > 0:
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _write_bytes(path: str | Path, data: bytes) -> None:
+    """バイト列でファイルを上書きする（BufferedWriter を経由しない）"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _read_text(path: str | Path) -> str:
+    return _read_bytes(path).decode("utf-8")
+
+
+def _write_text(path: str | Path, data: str) -> None:
+    _write_bytes(path, data.encode("utf-8"))
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# 一時ファイル (mkstemp は 0o600 で作る) を新規ファイルのパーミッションに揃えるため
+_UMASK = _current_umask()
+
+
+def _write_text_atomic(path: Path, data: str) -> None:
+    """同じディレクトリの一時ファイルに書いてから os.replace で置き換える
+
+    書き込み途中でプロセスが落ちても、元のファイルが壊れた状態で残らない。
+    シンボリックリンクはリンク先を置き換え、既存ファイルのパーミッションは引き継ぐ。
+    置き換え後は別 inode になるため、元のファイルへのハードリンクは変更前の内容のまま残る。
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        # 新規作成時は通常の open と同じく umask を適用したパーミッションにする
+        mode = 0o666 & ~_UMASK
+    else:
+        # rename はディレクトリの権限だけで通るため、上書きと同じく書き込み権限を確認する
+        if not os.access(target, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(path))
+    # 同じファイルを同時に書き込むプロセス同士が衝突しないよう、一時ファイル名は毎回変える
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        try:
+            os.fchmod(fd, mode)
+            _write_all(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+_base_dirs_ensured = False
+
+
 def ensure_base_dirs() -> None:
-    """ベースディレクトリとデフォルトテンプレートを作成する（未作成の場合）"""
+    """ベースディレクトリとデフォルトテンプレートを作成する（未作成の場合）
+
+    プロセス内で一度成功すれば以降の呼び出しは何もしない。
+    """
+    global _base_dirs_ensured
+    if _base_dirs_ensured:
+        return
+
     TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
     PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -35,14 +160,14 @@ def ensure_base_dirs() -> None:
     if not (BASE_DIR / ".git").exists():
         _run_git("init")
         gitignore = BASE_DIR / ".gitignore"
-        gitignore.write_text(".tmp/\n", encoding="utf-8")
+        _write_text(gitignore, ".tmp/\n")
 
     default_template_dir = TEMPLATES_DIR / "default"
     if not default_template_dir.exists():
         default_template_dir.mkdir()
-        (default_template_dir / "task.md").write_text(
-            DEFAULT_TEMPLATE_CONTENT, encoding="utf-8"
-        )
+        _write_text(default_template_dir / "task.md", DEFAULT_TEMPLATE_CONTENT)
+
+    _base_dirs_ensured = True
 
 
 # --- プロジェクト操作 ---
@@ -51,7 +176,10 @@ def ensure_base_dirs() -> None:
 def list_projects() -> list[str]:
     """プロジェクト名の一覧を返す"""
     ensure_base_dirs()
-    return sorted(d.name for d in PROJECTS_DIR.iterdir() if d.is_dir())
+    with os.scandir(PROJECTS_DIR) as it:
+        entries = [e for e in it if e.is_dir()]
+    entries.sort(key=attrgetter("name"))
+    return [e.name for e in entries]
 
 
 def create_project(name: str) -> Path:
@@ -70,6 +198,7 @@ def delete_project(name: str) -> None:
     if not project_dir.exists():
         raise FileNotFoundError(f"プロジェクト '{name}' が見つかりません")
     shutil.rmtree(project_dir)
+    _forget_status(project_dir)
 
 
 # --- タスク操作 ---
@@ -85,24 +214,24 @@ def _project_dir(project: str) -> Path:
 def list_tasks(project: str) -> list[dict]:
     """プロジェクト内のアクティブなタスク一覧を返す。各タスクの名前とステータスを含む。"""
     project_dir = _project_dir(project)
-    tasks = []
-    for d in sorted(project_dir.iterdir()):
-        if d.is_dir() and d.name != ARCHIVE_DIR_NAME:
-            tasks.append({"name": d.name, "status": _parse_status(d) or ""})
+    with os.scandir(project_dir) as it:
+        entries = [e for e in it if e.is_dir() and e.name != ARCHIVE_DIR_NAME]
+    entries.sort(key=attrgetter("name"))
+    tasks = [{"name": e.name, "status": _parse_status(e.path) or ""} for e in entries]
+    _save_status_index()
     return tasks
 
 
 def create_task(
     project: str, task_name: str, title: str, template: str = "default"
-) -> Path:
-    """テンプレートから新しいタスクディレクトリを作成する。パスを返す。
+) -> tuple[Path, list[str]]:
+    """テンプレートから新しいタスクディレクトリを作成する。(パス, 作成したファイル名一覧) を返す。
 
     task_name には日付プレフィックス (YYYYMMDD_) が自動付与される。
     """
-    project_dir = _project_dir(project)
-    prefix = datetime.now().strftime("%Y%m%d")
-    task_name = f"{prefix}_{task_name}"
-    task_dir = project_dir / task_name
+    now = datetime.now()
+    task_name = f"{now:%Y%m%d}_{task_name}"
+    task_dir = PROJECTS_DIR / project / task_name
     if task_dir.exists():
         raise FileExistsError(
             f"タスク '{task_name}' はプロジェクト '{project}' に既に存在します"
@@ -112,16 +241,26 @@ def create_task(
     if not template_dir.is_dir():
         raise FileNotFoundError(f"テンプレート '{template}' が見つかりません")
 
-    task_dir.mkdir()
+    # プロジェクトが存在しなければ mkdir が失敗するので事前確認はしない
+    try:
+        task_dir.mkdir()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"プロジェクト '{project}' が見つかりません") from None
 
     # テンプレートファイルをコピーしてプレースホルダを置換
-    for template_file in template_dir.iterdir():
-        if template_file.is_file():
-            content = template_file.read_text(encoding="utf-8")
-            rendered = render_template(content, title)
-            (task_dir / template_file.name).write_text(rendered, encoding="utf-8")
-
-    return task_dir
+    # 置換はデコードせずバイト列のまま行い、プレースホルダが無ければそのまま書き出す
+    files: list[str] = []
+    with os.scandir(template_dir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            data = _read_bytes(entry.path)
+            if b"{{" in data:
+                data = render_template_bytes(data, title, now)
+            _write_bytes(task_dir / entry.name, data)
+            files.append(entry.name)
+    files.sort()
+    return task_dir, files
 
 
 def delete_task(project: str, task_name: str) -> None:
@@ -132,6 +271,7 @@ def delete_task(project: str, task_name: str) -> None:
             f"タスク '{task_name}' がプロジェクト '{project}' に見つかりません"
         )
     shutil.rmtree(task_dir)
+    _forget_status(task_dir)
 
 
 def archive_task(project: str, task_name: str) -> Path:
@@ -150,6 +290,7 @@ def archive_task(project: str, task_name: str) -> Path:
     _run_git("add", str(task_dir))
     _run_git("mv", str(task_dir), str(dest))
     _run_git("commit", "-m", f"archive: {project}/{task_name}")
+    _forget_status(task_dir)
     return dest
 
 
@@ -166,6 +307,7 @@ def unarchive_task(project: str, task_name: str) -> Path:
     _run_git("add", str(task_dir))
     _run_git("mv", str(task_dir), str(dest))
     _run_git("commit", "-m", f"unarchive: {project}/{task_name}")
+    _forget_status(task_dir)
     return dest
 
 
@@ -174,10 +316,11 @@ def list_archived_tasks(project: str) -> list[dict]:
     archive_dir = _project_dir(project) / ARCHIVE_DIR_NAME
     if not archive_dir.is_dir():
         return []
-    tasks = []
-    for d in sorted(archive_dir.iterdir()):
-        if d.is_dir():
-            tasks.append({"name": d.name, "status": _parse_status(d) or ""})
+    with os.scandir(archive_dir) as it:
+        entries = [e for e in it if e.is_dir()]
+    entries.sort(key=attrgetter("name"))
+    tasks = [{"name": e.name, "status": _parse_status(e.path) or ""} for e in entries]
+    _save_status_index()
     return tasks
 
 
@@ -185,11 +328,12 @@ def list_archived_tasks(project: str) -> list[dict]:
 
 
 def _task_dir(project: str, task_name: str) -> Path:
-    project_dir = _project_dir(project)
-    path = project_dir / task_name
+    # アクティブタスクが見つかればプロジェクトの存在確認は不要
+    path = PROJECTS_DIR / project / task_name
     if path.is_dir():
         return path
     # アーカイブ内もフォールバックで探す
+    project_dir = _project_dir(project)
     archived = project_dir / ARCHIVE_DIR_NAME / task_name
     if archived.is_dir():
         return archived
@@ -201,17 +345,27 @@ def _task_dir(project: str, task_name: str) -> Path:
 def list_files(project: str, task_name: str) -> list[str]:
     """タスクディレクトリ内のファイル一覧を返す"""
     task_dir = _task_dir(project, task_name)
-    return sorted(f.name for f in task_dir.iterdir() if f.is_file())
+    with os.scandir(task_dir) as it:
+        entries = [e for e in it if e.is_file()]
+    entries.sort(key=attrgetter("name"))
+    return [e.name for e in entries]
 
 
-def get_file(project: str, task_name: str, filename: str) -> tuple[Path, str]:
-    """タスクディレクトリ内のファイルを読み取る。(パス, 内容) を返す。"""
-    file_path = _task_dir(project, task_name) / filename
+def get_file_with_rules(
+    project: str, task_name: str, filename: str
+) -> tuple[Path, str, str]:
+    """タスク内のファイルと適用ルールをまとめて読み取る。(パス, 内容, ルール) を返す。
+
+    タスクディレクトリの解決は一度だけ行い、タスクルールもそのディレクトリから読む。
+    """
+    task_dir = _task_dir(project, task_name)
+    file_path = task_dir / filename
     if not file_path.is_file():
         raise FileNotFoundError(
             f"ファイル '{filename}' がタスク '{task_name}' に見つかりません"
         )
-    return file_path, file_path.read_text(encoding="utf-8")
+    content = _read_text(file_path)
+    return file_path, content, _collect_rules(project, task_dir / RULES_FILENAME)
 
 
 def update_file(
@@ -225,8 +379,16 @@ def update_file(
         )
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
     old_path = TEMP_DIR / f"{project}_{task_name}_{filename}"
-    old_path.write_text(file_path.read_text(encoding="utf-8"), encoding="utf-8")
-    file_path.write_text(content, encoding="utf-8")
+    # 変更前のファイルはハードリンクで退避し、データはコピーしない。
+    # 新しい内容は別 inode に書いて置き換えるため、退避側は変更前の内容のまま残る。
+    # シンボリックリンクはリンク自体ではなくリンク先を退避する。
+    old_path.unlink(missing_ok=True)
+    try:
+        os.link(os.path.realpath(file_path), old_path)
+    except OSError:
+        # ハードリンク非対応のファイルシステムなど
+        shutil.copyfile(file_path, old_path)
+    _write_text_atomic(file_path, content)
     return old_path, file_path
 
 
@@ -237,7 +399,7 @@ def create_file(project: str, task_name: str, filename: str, content: str) -> Pa
         raise FileExistsError(
             f"ファイル '{filename}' はタスク '{task_name}' に既に存在します"
         )
-    file_path.write_text(content, encoding="utf-8")
+    _write_text_atomic(file_path, content)
     return file_path
 
 
@@ -254,35 +416,64 @@ def delete_file(project: str, task_name: str, filename: str) -> None:
 # --- ルール操作 ---
 
 
+@functools.lru_cache(maxsize=256)
+def _project_rules_path(project: str) -> str:
+    return os.path.join(PROJECTS_DIR, project, RULES_FILENAME)
+
+
+def _read_rules(path: str | Path) -> str:
+    """RULES.md の内容を返す。存在しないか通常ファイルでなければ空文字列を返す。
+
+    事前に存在確認をせず、open の失敗と開いた fd の fstat で判定する。
+    FIFO などで open がブロックしないよう O_NONBLOCK で開く。
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return ""
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return ""
+        return _read_all(fd, st.st_size).decode("utf-8").strip()
+    finally:
+        os.close(fd)
+
+
 def get_rules(project: str | None = None, task_name: str | None = None) -> str:
     """階層ルールを収集して結合する。全体 → プロジェクト → タスクの順。
 
     存在しないレベルはスキップする。ルールが一つもなければ空文字列を返す。
+    タスクはファイル操作と同じくアーカイブ内も探す。
     """
+    task_rules = None
+    if project and task_name:
+        try:
+            task_rules = _task_dir(project, task_name) / RULES_FILENAME
+        except FileNotFoundError:
+            pass
+    return _collect_rules(project, task_rules)
+
+
+def _collect_rules(project: str | None, task_rules: str | Path | None) -> str:
     sections: list[str] = []
 
     # 全体ルール
-    global_rules = BASE_DIR / RULES_FILENAME
-    if global_rules.is_file():
-        content = global_rules.read_text(encoding="utf-8").strip()
-        if content:
-            sections.append(f"=== 全体ルール ===\n{content}")
+    content = _read_rules(GLOBAL_RULES_PATH)
+    if content:
+        sections.append(f"=== 全体ルール ===\n{content}")
 
     # プロジェクトルール
     if project:
-        project_rules = PROJECTS_DIR / project / RULES_FILENAME
-        if project_rules.is_file():
-            content = project_rules.read_text(encoding="utf-8").strip()
-            if content:
-                sections.append(f"=== プロジェクトルール ({project}) ===\n{content}")
+        content = _read_rules(_project_rules_path(project))
+        if content:
+            sections.append(f"=== プロジェクトルール ({project}) ===\n{content}")
 
     # タスクルール
-    if project and task_name:
-        task_rules = PROJECTS_DIR / project / task_name / RULES_FILENAME
-        if task_rules.is_file():
-            content = task_rules.read_text(encoding="utf-8").strip()
-            if content:
-                sections.append(f"=== タスクルール ===\n{content}")
+    if task_rules is not None:
+        content = _read_rules(task_rules)
+        if content:
+            sections.append(f"=== タスクルール ===\n{content}")
 
     return "\n\n".join(sections)
 
@@ -308,9 +499,9 @@ def set_rules(
         rules_path = _project_dir(project) / RULES_FILENAME
     else:
         ensure_base_dirs()
-        rules_path = BASE_DIR / RULES_FILENAME
+        rules_path = GLOBAL_RULES_PATH
 
-    rules_path.write_text(content, encoding="utf-8")
+    _write_text_atomic(rules_path, content)
     return rules_path
 
 
@@ -320,7 +511,10 @@ def set_rules(
 def list_templates() -> list[str]:
     """テンプレート名の一覧を返す"""
     ensure_base_dirs()
-    return sorted(d.name for d in TEMPLATES_DIR.iterdir() if d.is_dir())
+    with os.scandir(TEMPLATES_DIR) as it:
+        entries = [e for e in it if e.is_dir()]
+    entries.sort(key=attrgetter("name"))
+    return [e.name for e in entries]
 
 
 def create_template(name: str) -> Path:
@@ -334,8 +528,11 @@ def create_template(name: str) -> Path:
 
 
 def git_status() -> str:
-    """~/.taskmark/ 内の未コミット変更を返す。"""
-    result = _run_git("status", "--short")
+    """~/.taskmark/ 内の未コミット変更を返す。
+
+    ポーリングされる前提のため、index のロック取得・書き戻しを行わない。
+    """
+    result = _run_git("--no-optional-locks", "status", "--short")
     return result.stdout.strip()
 
 
@@ -373,81 +570,263 @@ def git_commit(
         raise
 
 
-def _parse_status(task_dir: Path) -> str | None:
-    """タスクディレクトリ内の task.md から status を取得する"""
-    task_file = task_dir / "task.md"
-    if not task_file.is_file():
+# タスクディレクトリのパス -> [task.md の mtime_ns, ctime_ns, サイズ, inode 番号, status]
+_status_index: dict[str, list] | None = None
+_status_index_dirty = False
+
+
+def _get_status_index() -> dict[str, list]:
+    """ステータスインデックスを返す。初回のみファイルから読み込む。
+
+    ファイルが無い・壊れている場合は空から始め、各 task.md を読み直して再構築する。
+    """
+    global _status_index
+    if _status_index is None:
+        try:
+            data = json.loads(_read_bytes(STATUS_INDEX_PATH))
+        except (OSError, ValueError):
+            data = None
+        _status_index = data if isinstance(data, dict) else {}
+    return _status_index
+
+
+def _save_status_index() -> None:
+    """ステータスインデックスに変更があればアトミックに書き出す
+
+    書き込めない場合は警告ログのみ出し、呼び出し元の処理は失敗させない。
+    """
+    global _status_index_dirty
+    if not _status_index_dirty or _status_index is None:
+        return
+    try:
+        try:
+            CACHE_DIR.mkdir()
+        except FileExistsError:
+            pass
+        else:
+            # キャッシュディレクトリごと git の管理対象外にする
+            _write_text(CACHE_DIR / ".gitignore", "*\n")
+        _write_text_atomic(
+            STATUS_INDEX_PATH, json.dumps(_status_index, ensure_ascii=False)
+        )
+    except OSError as e:
+        logger.warning("ステータスインデックスを保存できません: %s", e)
+        return
+    _status_index_dirty = False
+
+
+def _forget_status(path: str | Path) -> None:
+    """指定ディレクトリ以下のタスクをステータスインデックスから取り除く"""
+    global _status_index_dirty
+    index = _get_status_index()
+    path = str(path)
+    prefix = path + os.sep
+    stale = [k for k in index if k == path or k.startswith(prefix)]
+    for k in stale:
+        del index[k]
+    if stale:
+        _status_index_dirty = True
+        _save_status_index()
+
+
+def _parse_status(task_dir: str | Path) -> str | None:
+    """タスクディレクトリ内の task.md から status を取得する
+
+    task.md の mtime・ctime・サイズ・inode がステータスインデックスと一致すれば、
+    ファイルを開かずに返す。更新直後の task.md はインデックスに載せない。
+    """
+    global _status_index_dirty
+    task_dir = str(task_dir)
+    task_file = os.path.join(task_dir, "task.md")
+    try:
+        st = os.stat(task_file)
+    except FileNotFoundError:
         return None
-    lines = task_file.read_text(encoding="utf-8").splitlines()
-    if not lines or lines[0].strip() != "---":
+    if not stat.S_ISREG(st.st_mode):
         return None
-    for line in lines[1:]:
-        if line.strip() == "---":
-            break
-        if line.strip().startswith("status:"):
-            return line.split(":", 1)[1].strip()
-    return None
+    index = _get_status_index()
+    key = [st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino]
+    entry = index.get(task_dir)
+    if isinstance(entry, list) and len(entry) == 5 and entry[:4] == key:
+        return entry[4]
+    status = _read_status(task_file)
+    if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) >= STATUS_INDEX_RACY_NS:
+        index[task_dir] = [*key, status]
+        _status_index_dirty = True
+    elif index.pop(task_dir, None) is not None:
+        _status_index_dirty = True
+    return status
+
+
+def _read_status(task_file: str) -> str | None:
+    """task.md の frontmatter から status を読み取る。
+
+    ファイル全体は読まず、先頭 STATUS_READ_SIZE バイトのみを対象とする。
+    """
+    # ファイルオブジェクトを作らず open/read のシステムコールだけで読む
+    fd = os.open(task_file, os.O_RDONLY)
+    try:
+        head = os.read(fd, STATUS_READ_SIZE)
+    finally:
+        os.close(fd)
+    if len(head) == STATUS_READ_SIZE:
+        # 途中で切れた最終行は捨てる
+        head = head[: head.rfind(b"\n") + 1]
+    # 行ごとのオブジェクトを作らず、bytes.find で区切りと status 行を探す
+    first_nl = head.find(b"\n")
+    if first_nl < 0 or head[:first_nl].strip() != b"---":
+        return None
+    end = head.find(b"\n---", first_nl)
+    if end < 0:
+        end = len(head)
+    i = head.find(b"\nstatus:", first_nl, end)
+    if i < 0:
+        return None
+    i += len(b"\nstatus:")
+    j = head.find(b"\n", i, end)
+    if j < 0:
+        j = end
+    return head[i:j].strip().decode("utf-8", errors="replace")
 
 
-def search_tasks(query: str, project: str | None = None) -> list[dict]:
+def search_tasks(
+    query: str,
+    project: str | None = None,
+    max_results: int | None = None,
+    max_lines: int = 5,
+) -> list[dict]:
     """タスクファイル内をキーワード検索する。マッチしたタスクの情報を返す。
 
     アクティブタスクとアーカイブ済みタスクの両方を検索対象とする。
+    ファイルの読み込みとマッチングはスレッドプールで並列に行う。
+    max_results 件に達した時点で残りのファイルは読まずに打ち切る。
+    各ファイルのマッチ行は最大 max_lines 行まで返す。
     """
     ensure_base_dirs()
-    results: list[dict] = []
 
     if project:
-        project_dirs = [(_project_dir(project), project)]
+        project_dirs = [(str(_project_dir(project)), project)]
     else:
-        project_dirs = [(d, d.name) for d in PROJECTS_DIR.iterdir() if d.is_dir()]
+        project_dirs = [
+            (e.path, e.name) for e in _scandir_sorted(PROJECTS_DIR) if e.is_dir()
+        ]
 
-    query_lower = query.lower()
-
-    for proj_dir, proj_name in project_dirs:
+    # (プロジェクト名, タスク名, ファイル名, ファイルパス, アーカイブ済みか) を収集
+    targets: list[tuple[str, str, str, str, bool]] = []
+    for proj_path, proj_name in project_dirs:
         # アクティブタスク + アーカイブ済みタスクを収集
-        task_entries: list[tuple[Path, bool]] = []
-        for d in sorted(proj_dir.iterdir()):
+        task_entries: list[tuple[os.DirEntry[str], bool]] = []
+        for d in _scandir_sorted(proj_path):
             if not d.is_dir():
                 continue
             if d.name == ARCHIVE_DIR_NAME:
-                for ad in sorted(d.iterdir()):
-                    if ad.is_dir():
-                        task_entries.append((ad, True))
+                task_entries.extend(
+                    (ad, True) for ad in _scandir_sorted(d.path) if ad.is_dir()
+                )
             else:
                 task_entries.append((d, False))
 
-        for task_dir, archived in task_entries:
-            for file_path in sorted(task_dir.iterdir()):
-                if not file_path.is_file():
-                    continue
-                content = file_path.read_text(encoding="utf-8")
-                if query_lower in content.lower():
-                    matched_lines = [
-                        line.strip()
-                        for line in content.splitlines()
-                        if query_lower in line.lower()
-                    ]
-                    results.append(
-                        {
-                            "project": proj_name,
-                            "task": task_dir.name,
-                            "file": file_path.name,
-                            "matched_lines": matched_lines[:5],
-                            "archived": archived,
-                        }
+        for task_entry, archived in task_entries:
+            for f in _scandir_sorted(task_entry.path):
+                if f.is_file():
+                    targets.append(
+                        (proj_name, task_entry.name, f.name, f.path, archived)
                     )
+
+    if not targets:
+        return []
+
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    workers = min(SEARCH_MAX_WORKERS, len(targets))
+    results: list[dict] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        scanned = executor.map(lambda t: _scan_file(t[3], pattern, max_lines), targets)
+        for (proj_name, task_name, filename, _, archived), matched_lines in zip(
+            targets, scanned
+        ):
+            if matched_lines is None:
+                continue
+            results.append(
+                {
+                    "project": proj_name,
+                    "task": task_name,
+                    "file": filename,
+                    "matched_lines": matched_lines,
+                    "archived": archived,
+                }
+            )
+            if max_results is not None and len(results) >= max_results:
+                # 未着手のファイル読み込みは取り消す
+                executor.shutdown(cancel_futures=True)
+                break
     return results
 
 
+def _scandir_sorted(path: str | Path) -> list[os.DirEntry[str]]:
+    """ディレクトリ内のエントリを名前順で返す"""
+    with os.scandir(path) as it:
+        entries = list(it)
+    entries.sort(key=attrgetter("name"))
+    return entries
+
+
+def _scan_file(
+    file_path: str, pattern: re.Pattern[str], max_lines: int
+) -> list[str] | None:
+    """ファイル内を検索し、マッチした行を返す。マッチしなければ None を返す。
+
+    読み込めないファイルやテキストでないファイルは検索全体を失敗させずにスキップする。
+    """
+    try:
+        content = _read_bytes(file_path, sequential=True).decode("utf-8")
+    except UnicodeDecodeError:
+        logger.debug("UTF-8 でないファイルを検索対象から除外: %s", file_path)
+        return None
+    except OSError as e:
+        logger.warning("検索中にファイルを読み込めませんでした: %s (%s)", file_path, e)
+        return None
+    match = pattern.search(content)
+    if match is None:
+        return None
+    return _matched_lines(content, pattern, match, max_lines)
+
+
+def _matched_lines(
+    content: str, pattern: re.Pattern[str], match: re.Match[str], limit: int = 5
+) -> list[str]:
+    """最初のマッチから順に、マッチを含む行を最大 limit 行返す。
+
+    行分割はせず、マッチ位置の前後の改行を探して該当行だけを切り出す。
+    """
+    lines: list[str] = []
+    size = len(content)
+    while match is not None and match.start() < size and len(lines) < limit:
+        start = content.rfind("\n", 0, match.start()) + 1
+        end = content.find("\n", match.start())
+        if end < 0:
+            end = size
+        lines.append(content[start:end].strip())
+        match = pattern.search(content, end + 1)
+    return lines
+
+
 def list_tasks_by_status(project: str, status: str) -> list[str]:
     """指定ステータスに一致するタスク名の一覧を返す"""
+    return list(iter_tasks_by_status(project, status))
+
+
+def iter_tasks_by_status(project: str, status: str) -> Iterator[str]:
+    """指定ステータスに一致するタスク名を名前順に返す
+
+    呼び出し側で結合するだけの場合に、名前のリストを作らずに済む。
+    """
     project_dir = _project_dir(project)
-    return sorted(
-        d.name
-        for d in project_dir.iterdir()
-        if d.is_dir() and _parse_status(d) == status
-    )
+    with os.scandir(project_dir) as it:
+        entries = [e for e in it if e.is_dir() and _parse_status(e.path) == status]
+    _save_status_index()
+    entries.sort(key=attrgetter("name"))
+    for e in entries:
+        yield e.name
 
 
 def revert_file(project: str, task_name: str, filename: str) -> None:
@@ -458,7 +837,7 @@ def revert_file(project: str, task_name: str, filename: str) -> None:
             f"ファイル '{filename}' の変更前データがtmpに見つかりません"
         )
     file_path = _task_dir(project, task_name) / filename
-    file_path.write_text(tmp_path.read_text(encoding="utf-8"), encoding="utf-8")
+    _write_bytes(file_path, _read_bytes(tmp_path))
     tmp_path.unlink()
 
 
@@ -466,18 +845,19 @@ def tmp_stats() -> dict:
     """tmpディレクトリのファイル数と合計サイズを返す"""
     if not TEMP_DIR.exists():
         return {"file_count": 0, "total_bytes": 0}
-    files = [f for f in TEMP_DIR.iterdir() if f.is_file()]
-    total_bytes = sum(f.stat().st_size for f in files)
-    return {"file_count": len(files), "total_bytes": total_bytes}
+    with os.scandir(TEMP_DIR) as it:
+        sizes = [e.stat().st_size for e in it if e.is_file()]
+    return {"file_count": len(sizes), "total_bytes": sum(sizes)}
 
 
 def clear_tmp() -> int:
     """tmpディレクトリ内の全ファイルを削除する。削除したファイル数を返す。"""
     if not TEMP_DIR.exists():
         return 0
-    files = [f for f in TEMP_DIR.iterdir() if f.is_file()]
+    with os.scandir(TEMP_DIR) as it:
+        files = [e.path for e in it if e.is_file()]
     for f in files:
-        f.unlink()
+        os.unlink(f)
     return len(files)
 
 
@@ -487,5 +867,5 @@ def add_template_file(template: str, filename: str, content: str) -> Path:
     if not template_dir.is_dir():
         raise FileNotFoundError(f"テンプレート '{template}' が見つかりません")
     file_path = template_dir / filename
-    file_path.write_text(content, encoding="utf-8")
+    _write_text(file_path, content)
     return file_path